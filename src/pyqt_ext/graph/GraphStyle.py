@@ -1,9 +1,10 @@
 """ Data interface and widgets for storing/editing the style of a graph.
 
-Style is stored in hashable dict.
+Style is stored in a lightweight mapping (not a dict, use dict(style) where a dict is needed, e.g., for json).
 """
 
 from __future__ import annotations
+from collections.abc import Iterator, MutableMapping
 from qtpy.QtCore import *
 from qtpy.QtGui import *
 from qtpy.QtWidgets import *
@@ -11,8 +12,27 @@ from pyqt_ext.utils import ColorType, toQColor, toColorStr
 from pyqt_ext.widgets import ColorButton, CollapsibleSection
 
 
-class GraphStyle(dict):
-    """ Hashable style dict for graph data.
+# combobox labels for line styles
+_LINESTYLE_LABELS = {
+    'No Line': 'none',
+    'Solid Line': '-',
+    'Dash Line': '--',
+    'Dot Line': ':',
+    'Dash Dot Line': '-.',
+    'Dash Dot Dot Line': '-..',
+}
+
+# lowercase line style or label -> label
+_LINESTYLE_LABEL_LOOKUP = {key.lower(): key for key in _LINESTYLE_LABELS}
+_LINESTYLE_LABEL_LOOKUP.update({value: key for key, value in _LINESTYLE_LABELS.items()})
+
+# styles edited in each panel section
+_LINE_STYLE_KEYS = frozenset(['color', 'linestyle', 'linewidth'])
+_MARKER_STYLE_KEYS = frozenset(['marker', 'markersize', 'markeredgestyle', 'markeredgewidth', 'markeredgecolor', 'markerfacecolor'])
+
+
+class GraphStyle(MutableMapping):
+    """ Style mapping for graph data.
 
     'color': str
     'linestyle': str
@@ -23,65 +43,122 @@ class GraphStyle(dict):
     'markeredgewidth': float
     'markeredgecolor': str
     'markerfacecolor': str
+
+    Each style is stored in its own slot (None = not set),
+    which is much lighter and faster than a dict per instance.
+
+    !!! Not a dict subclass, so isinstance(style, dict) is False and json cannot serialize it directly.
+        Use dict(style) to get a plain dict of the explicitly set styles.
+        Only the styles above (or their alternate names) can be set, other keys raise KeyError.
+    
+    Indexing (style[key]) falls back to related styles and defaults for unset keys,
+    whereas get, pop and setdefault only consider explicitly set styles.
     """
 
+    __slots__ = ('_color', '_linestyle', '_linewidth', '_marker', '_markersize', '_markeredgestyle', '_markeredgewidth', '_markeredgecolor', '_markerfacecolor')
+
+    # style key -> slot name
+    _SLOTS = {slot[1:]: slot for slot in __slots__}
+
     # matched lists of string reprs and Qt.PenStyles
     linestyles = ['none', '-', '--', ':', '-.', '-..']
     penstyles = [Qt.PenStyle.NoPen, Qt.PenStyle.SolidLine, Qt.PenStyle.DashLine, Qt.PenStyle.DotLine, Qt.PenStyle.DashDotLine, Qt.PenStyle.DashDotDotLine]
+    _LINESTYLE_BY_PENSTYLE = dict(zip(penstyles, linestyles))
 
-    def __init__(self, *args, **kwargs):
-        dict.__init__(self, *args, **kwargs)
-
-        # alternate key names
-        self._keymap = {
-            'c': 'color',
-            'ls': 'linestyle',
-            'lw': 'linewidth',
-            'symbol': 'marker',
-            'm': 'marker',
-            'ms': 'markersize',
-            'mes': 'markeredgestyle',
-            'mew': 'markeredgewidth',
-            'mec': 'markeredgecolor',
-            'mfc': 'markerfacecolor',
-        }
+    # alternate key names
+    _KEYMAP = {
+        'c': 'color',
+        'ls': 'linestyle',
+        'lw': 'linewidth',
+        'symbol': 'marker',
+        'm': 'marker',
+        'ms': 'markersize',
+        'mes': 'markeredgestyle',
+        'mew': 'markeredgewidth',
+        'mec': 'markeredgecolor',
+        'mfc': 'markerfacecolor',
+    }
 
-        # default values
-        self._defaults = {
-            'linestyle': '-',
-            'linewidth': 1,
-            'marker': 'none',
-            'markersize': 10,
-            'markeredgestyle': '-',
-            'markeredgewidth': 1,
-        }
+    # default values
+    _DEFAULTS = {
+        'linestyle': '-',
+        'linewidth': 1,
+        'marker': 'none',
+        'markersize': 10,
+        'markeredgestyle': '-',
+        'markeredgewidth': 1,
+    }
+
+    def __init__(self, *args, **kwargs):
+        for slot in GraphStyle.__slots__:
+            setattr(self, slot, None)
+        if args or kwargs:
+            self.update(*args, **kwargs)
     
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
     
-    def __getitem__(self, key: str):
+    def __iter__(self) -> Iterator[str]:
+        for key, slot in GraphStyle._SLOTS.items():
+            if getattr(self, slot) is not None:
+                yield key
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+    
+    @staticmethod
+    def _resolve_key(key: str) -> str:
+        """ Return the canonical name for key (lowercase with aliases resolved).
+        """
         key = key.lower()
-        if key in self._keymap:
-            key = self._keymap[key]
-        if key in self:
-            return dict.__getitem__(self, key)
+        return GraphStyle._KEYMAP.get(key, key)
+    
+    def get(self, key: str, default=None):
+        """ Return the explicitly set value for key (no fallbacks).
+        """
+        if not isinstance(key, str):
+            # styles only have str keys
+            return default
+        slot = GraphStyle._SLOTS.get(GraphStyle._resolve_key(key), None)
+        if slot is None:
+            return default
+        value = getattr(self, slot)
+        if value is None:
+            return default
+        return value
+    
+    def __getitem__(self, key: str):
+        key = GraphStyle._resolve_key(key)
+        slot = GraphStyle._SLOTS.get(key, None)
+        if slot is None:
+            # unknown style
+            return None
+        value = getattr(self, slot)
+        if value is not None:
+            return value
         # key not found...
         if key == 'markeredgewidth':
-            if 'linewidth' in self:
-                return self['linewidth']
+            if self._linewidth is not None:
+                return self._linewidth
         elif key == 'markeredgecolor':
-            if 'color' in self:
-                return self['color']
+            if self._color is not None:
+                return self._color
         elif key == 'markerfacecolor':
-            if 'markeredgecolor' in self:
-                return self['markeredgecolor']
-            elif 'color' in self:
-                return self['color']
-        if key in self._defaults:
-            return self._defaults[key]
+            if self._markeredgecolor is not None:
+                return self._markeredgecolor
+            elif self._color is not None:
+                return self._color
+        if key in GraphStyle._DEFAULTS:
+            return GraphStyle._DEFAULTS[key]
     
     def __setitem__(self, key: str, value):
-        key = key.lower()
-        if key in self._keymap:
-            key = self._keymap[key]
+        key = GraphStyle._resolve_key(key)
+        slot = GraphStyle._SLOTS.get(key, None)
+        if slot is None:
+            raise KeyError(f'Unknown graph style: {key}')
         if key.endswith('color'):
             if value is not None:
                 value = toColorStr(value)
@@ -91,7 +168,7 @@ class GraphStyle(dict):
             elif isinstance(value, int):
                 value = GraphStyle.linestyles[value]
             elif isinstance(value, Qt.PenStyle):
-                value = GraphStyle.linestyles[GraphStyle.penstyles.index(value)]
+                value = GraphStyle._LINESTYLE_BY_PENSTYLE[value]
             elif isinstance(value, str):
                 if value == '.-':
                     value = '-.'
@@ -109,68 +186,106 @@ class GraphStyle(dict):
         elif key == 'markeredgewidth':
             if value is not None:
                 value = max(0, value)
-        if value is None:
-            del self[key]
-            return
-        dict.__setitem__(self, key, value)
+        # None unsets the style
+        setattr(self, slot, value)
     
     def __delitem__(self, key: str):
-        key = key.lower()
-        if key in self._keymap:
-            key = self._keymap[key]
-        if key in self:
-            dict.__delitem__(self, key)
+        slot = GraphStyle._SLOTS.get(GraphStyle._resolve_key(key), None)
+        if slot is not None:
+            setattr(self, slot, None)
+    
+    def pop(self, key: str, *default):
+        """ Remove and return the explicitly set value for key (no fallbacks).
+
+        If key is not set, return default if given, otherwise raise KeyError.
+        """
+        slot = GraphStyle._SLOTS.get(GraphStyle._resolve_key(key), None) if isinstance(key, str) else None
+        value = None if slot is None else getattr(self, slot)
+        if value is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        setattr(self, slot, None)
+        return value
+    
+    def setdefault(self, key: str, default=None):
+        """ Return the explicitly set value for key, first setting it to default if not set.
+        """
+        value = self.get(key)
+        if value is None:
+            self[key] = default
+            value = self.get(key)
+        return value
+    
+    def copy(self) -> GraphStyle:
+        return GraphStyle(self)
     
     def color(self) -> str | None:
-        return self['color']
+        return self._color
     
     def setColor(self, value: ColorType | None):
         self['color'] = value
     
     def lineStyle(self) -> str:
-        return self['linestyle']
+        if self._linestyle is None:
+            return GraphStyle._DEFAULTS['linestyle']
+        return self._linestyle
     
     def setLineStyle(self, value: str | int | Qt.PenStyle | None):
         self['linestyle'] = value
     
     def lineWidth(self) -> float:
-        return self['linewidth']
+        if self._linewidth is None:
+            return GraphStyle._DEFAULTS['linewidth']
+        return self._linewidth
     
     def setLineWidth(self, value: float):
         self['linewidth'] = value
     
     def marker(self) -> str:
-        return self['marker']
+        if self._marker is None:
+            return GraphStyle._DEFAULTS['marker']
+        return self._marker
     
     def setMarker(self, value: str | None):
         self['marker'] = value
     
     def markerSize(self) -> float:
-        return self['markersize']
+        if self._markersize is None:
+            return GraphStyle._DEFAULTS['markersize']
+        return self._markersize
     
     def setMarkerSize(self, value: float):
         self['markersize'] = value
     
     def markerEdgeStyle(self) -> str:
-        return self['markeredgestyle']
+        if self._markeredgestyle is None:
+            return GraphStyle._DEFAULTS['markeredgestyle']
+        return self._markeredgestyle
     
     def setMarkerEdgeStyle(self, value: str | int | Qt.PenStyle | None):
         self['markeredgestyle'] = value
     
     def markerEdgeWidth(self) -> float:
-        return self['markeredgewidth']
+        if self._markeredgewidth is None:
+            return self.lineWidth()
+        return self._markeredgewidth
     
     def setMarkerEdgeWidth(self, value: float):
         self['markeredgewidth'] = value
     
     def markerEdgeColor(self) -> str:
-        return self['markeredgecolor']
+        if self._markeredgecolor is None:
+            return self._color
+        return self._markeredgecolor
     
     def setMarkerEdgeColor(self, value: ColorType | None):
         self['markeredgecolor'] = value
     
     def markerFaceColor(self) -> str:
-        return self['markerfacecolor']
+        if self._markerfacecolor is None:
+            return self.markerEdgeColor()
+        return self._markerfacecolor
     
     def setMarkerFaceColor(self, value: ColorType | None):
         self['markerfacecolor'] = value
@@ -178,40 +293,35 @@ class GraphStyle(dict):
 
 class GraphStylePanel(QWidget):
 
+    graphStyleChanged = Signal()
+
     def __init__(self, styles: list[str] = None, *args, **kwargs):
         QWidget.__init__(self, *args, **kwargs)
 
         if styles is None:
             styles = ['color', 'linestyle', 'linewidth', 'marker', 'markersize', 'markeredgestyle', 'markeredgewidth', 'markeredgecolor', 'markerfacecolor']
         self.styles = [style.lower() for style in styles]
+        self._style_set = frozenset(self.styles)
 
         vbox = QVBoxLayout(self)
         vbox.setContentsMargins(10, 10, 10, 10)
         vbox.setSpacing(10)
 
         # line
-        if set(['color', 'linestyle', 'linewidth']).intersection(self.styles):
+        if _LINE_STYLE_KEYS & self._style_set:
             self.lineSection = CollapsibleSection(title='Line')
             form = QFormLayout()
             form.setContentsMargins(10, 10, 10, 10)
             form.setSpacing(10)
-            if 'color' in self.styles:
+            if 'color' in self._style_set:
                 self.colorButton = ColorButton()
                 form.addRow('Color', self.colorButton)
-            if 'linestyle' in self.styles:
+            if 'linestyle' in self._style_set:
                 self.lineStyleComboBox = QComboBox()
-                self._lineStyles = {
-                    'No Line': 'none',
-                    'Solid Line': '-',
-                    'Dash Line': '--',
-                    'Dot Line': ':',
-                    'Dash Dot Line': '-.',
-                    'Dash Dot Dot Line': '-..',
-                }
-                self.lineStyleComboBox.addItems(list(self._lineStyles.keys()))
+                self.lineStyleComboBox.addItems(list(_LINESTYLE_LABELS))
                 self.lineStyleComboBox.setCurrentIndex(1)
                 form.addRow('Style', self.lineStyleComboBox)
-            if 'linewidth' in self.styles:
+            if 'linewidth' in self._style_set:
                 self.lineWidthSpinBox = QDoubleSpinBox()
                 self.lineWidthSpinBox.setMinimum(0)
                 self.lineWidthSpinBox.setValue(1)
@@ -220,44 +330,39 @@ class GraphStylePanel(QWidget):
             vbox.addWidget(self.lineSection)
         
         # marker
-        if set(['marker', 'markersize', 'markeredgestyle', 'markeredgewidth', 'markeredgecolor', 'markerfacecolor']).intersection(self.styles):
+        if _MARKER_STYLE_KEYS & self._style_set:
             self.markerSection = CollapsibleSection(title='Marker')
             form = QFormLayout()
             form.setContentsMargins(10, 10, 10, 10)
             form.setSpacing(10)
-            if 'marker' in self.styles:
+            if 'marker' in self._style_set:
                 self.markerComboBox = QComboBox()
                 # pyqtgraph default markers
-                self.markerComboBox.addItems(['None', 'Circle', 'Triangle Down', 'Triangle Up', 'Triangle Right', 'Triangle Left', 'Square', 'Diamond', 'Pentagon', 'Hexagon', 'Star', 'Plus', 'Cross'])
+                markerLabels = ['None', 'Circle', 'Triangle Down', 'Triangle Up', 'Triangle Right', 'Triangle Left', 'Square', 'Diamond', 'Pentagon', 'Hexagon', 'Star', 'Plus', 'Cross']
+                self.markerComboBox.addItems(markerLabels)
+                # lowercase label -> combobox index
+                self._markerIndexByLabel = {label.lower(): i for i, label in enumerate(markerLabels)}
                 self.markerComboBox.setCurrentIndex(0)
                 form.addRow('Symbol', self.markerComboBox)
-            if 'markersize' in self.styles:
+            if 'markersize' in self._style_set:
                 self.markerSizeSpinBox = QDoubleSpinBox()
                 self.markerSizeSpinBox.setMinimum(0)
                 self.markerSizeSpinBox.setValue(10)
                 form.addRow('Size', self.markerSizeSpinBox)
-            if 'markeredgestyle' in self.styles:
+            if 'markeredgestyle' in self._style_set:
                 self.markerEdgeStyleComboBox = QComboBox()
-                self._markerEdgeStyles = {
-                    'No Line': 'none',
-                    'Solid Line': '-',
-                    'Dash Line': '--',
-                    'Dot Line': ':',
-                    'Dash Dot Line': '-.',
-                    'Dash Dot Dot Line': '-..',
-                }
-                self.markerEdgeStyleComboBox.addItems(list(self._markerEdgeStyles.keys()))
+                self.markerEdgeStyleComboBox.addItems(list(_LINESTYLE_LABELS))
                 self.markerEdgeStyleComboBox.setCurrentIndex(1)
                 form.addRow('Edge Style', self.markerEdgeStyleComboBox)
-            if 'markeredgewidth' in self.styles:
+            if 'markeredgewidth' in self._style_set:
                 self.markerEdgeWidthSpinBox = QDoubleSpinBox()
                 self.markerEdgeWidthSpinBox.setMinimum(0)
                 self.markerEdgeWidthSpinBox.setValue(1)
                 form.addRow('Edge Width', self.markerEdgeWidthSpinBox)
-            if 'markeredgecolor' in self.styles:
+            if 'markeredgecolor' in self._style_set:
                 self.markerEdgeColorButton = ColorButton()
                 form.addRow('Edge Color', self.markerEdgeColorButton)
-            if 'markerfacecolor' in self.styles:
+            if 'markerfacecolor' in self._style_set:
                 self.markerFaceColorButton = ColorButton()
                 form.addRow('Face Color', self.markerFaceColorButton)
             self.markerSection.setContentLayout(form)
@@ -268,111 +373,152 @@ class GraphStylePanel(QWidget):
             vbox.itemAt(0).widget().expand()
         
         vbox.addStretch()
+
+        # forward edits in any style widget as a single graphStyleChanged signal
+        self._styleWidgets: list[QWidget] = []
+        for name in ['colorButton', 'markerEdgeColorButton', 'markerFaceColorButton']:
+            widget = getattr(self, name, None)
+            if widget is not None:
+                widget.colorChanged.connect(self.graphStyleChanged)
+                self._styleWidgets.append(widget)
+        for name in ['lineStyleComboBox', 'markerComboBox', 'markerEdgeStyleComboBox']:
+            widget = getattr(self, name, None)
+            if widget is not None:
+                widget.currentIndexChanged.connect(self.graphStyleChanged)
+                self._styleWidgets.append(widget)
+        for name in ['lineWidthSpinBox', 'markerSizeSpinBox', 'markerEdgeWidthSpinBox']:
+            widget = getattr(self, name, None)
+            if widget is not None:
+                widget.valueChanged.connect(self.graphStyleChanged)
+                self._styleWidgets.append(widget)
+
+        # style -> handler dispatch tables
+        self._getters = {
+            'color': self._getColor,
+            'linestyle': self._getLineStyle,
+            'linewidth': self._getLineWidth,
+            'marker': self._getMarker,
+            'markersize': self._getMarkerSize,
+            'markeredgestyle': self._getMarkerEdgeStyle,
+            'markeredgewidth': self._getMarkerEdgeWidth,
+            'markeredgecolor': self._getMarkerEdgeColor,
+            'markerfacecolor': self._getMarkerFaceColor,
+        }
+        self._setters = {
+            'color': self._setColor,
+            'linestyle': self._setLineStyle,
+            'linewidth': self._setLineWidth,
+            'marker': self._setMarker,
+            'markersize': self._setMarkerSize,
+            'markeredgestyle': self._setMarkerEdgeStyle,
+            'markeredgewidth': self._setMarkerEdgeWidth,
+            'markeredgecolor': self._setMarkerEdgeColor,
+            'markerfacecolor': self._setMarkerFaceColor,
+        }
     
     def graphStyle(self) -> GraphStyle:
         graphStyle = GraphStyle()
         for style in self.styles:
-            if style == 'color':
-                color = self.colorButton.color()
-                if color is not None:
-                    graphStyle.setColor(color)
-            elif style == 'linestyle':
-                key = self.lineStyleComboBox.currentText()
-                lineStyle = self._lineStyles[key]
-                graphStyle.setLineStyle(lineStyle)
-            elif style == 'linewidth':
-                lineWidth = self.lineWidthSpinBox.value()
-                graphStyle.setLineWidth(lineWidth)
-            elif style == 'marker':
-                marker = self.markerComboBox.currentText().lower()
-                graphStyle.setMarker(marker)
-            elif style == 'markersize':
-                markerSize = self.markerSizeSpinBox.value()
-                graphStyle.setMarkerSize(markerSize)
-            elif style == 'markeredgestyle':
-                key = self.markerEdgeStyleComboBox.currentText()
-                markerEdgeStyle = self._markerEdgeStyles[key]
-                graphStyle.setMarkerEdgeStyle(markerEdgeStyle)
-            elif style == 'markeredgewidth':
-                markerEdgeWidth = self.markerEdgeWidthSpinBox.value()
-                graphStyle.setMarkerEdgeWidth(markerEdgeWidth)
-            elif style == 'markeredgecolor':
-                markerEdgeColor = self.markerEdgeColorButton.color()
-                if markerEdgeColor is not None:
-                    graphStyle.setMarkerEdgeColor(markerEdgeColor)
-            elif style == 'markerfacecolor':
-                markerFaceColor = self.markerFaceColorButton.color()
-                if markerFaceColor is not None:
-                    graphStyle.setMarkerFaceColor(markerFaceColor)
+            getter = self._getters.get(style, None)
+            if getter is not None:
+                getter(graphStyle)
         return graphStyle
     
     def setGraphStyle(self, graphStyle: GraphStyle):
-        for style in self.styles:
-            if style == 'color':
-                try:
-                    color = graphStyle.color()
-                    self.colorButton.setColor(color)
-                except Exception:
-                    pass
-            elif style == 'linestyle':
-                try:
-                    lineStyle = graphStyle.lineStyle()
-                    for key, value in self._lineStyles.items():
-                        if value.lower() == lineStyle.lower() or key.lower() == lineStyle.lower():
-                            lineStyle = key
-                            break
-                    self.lineStyleComboBox.setCurrentText(lineStyle)
-                except Exception:
-                    pass
-            elif style == 'linewidth':
-                try:
-                    lineWidth = graphStyle.lineWidth()
-                    self.lineWidthSpinBox.setValue(lineWidth)
-                except Exception:
-                    pass
-            elif style == 'marker':
-                try:
-                    marker = graphStyle.marker()
-                    for i, item in enumerate(self.markerComboBox.items()):
-                        if item.text().lower() == marker.lower():
-                            self.markerComboBox.setCurrentIndex(i)
-                            break
-                except Exception:
-                    pass
-            elif style == 'markersize':
-                try:
-                    markerSize = graphStyle.markerSize()
-                    self.markerSizeSpinBox.setValue(markerSize)
-                except Exception:
-                    pass
-            elif style == 'markeredgestyle':
-                try:
-                    markerEdgeStyle = graphStyle.markerEdgeStyle()
-                    for key, value in self._markerEdgeStyles.items():
-                        if value.lower() == markerEdgeStyle.lower() or key.lower() == markerEdgeStyle.lower():
-                            markerEdgeStyle = key
-                            break
-                    self.markerEdgeStyleComboBox.setCurrentText(markerEdgeStyle)
-                except Exception:
-                    pass
-            elif style == 'markeredgewidth':
-                try:
-                    markerEdgeWidth = graphStyle.setMarkerEdgeWidth()
-                    self.markerEdgeWidthSpinBox.setValue(markerEdgeWidth)
-                except Exception:
-                    pass
-            elif style == 'markeredgecolor':
-                try:
-                    markerEdgeColor = graphStyle.markerEdgeColor()
-                    self.markerEdgeColorButton.setColor(markerEdgeColor)
-                except Exception:
-                    pass
-            elif style == 'markerfacecolor':
-                try:
-                    markerFaceColor = graphStyle.markerFaceColor()
-                    self.markerFaceColorButton.setColor(markerFaceColor)
-                except Exception:
-                    pass
+        # block widget signals during the bulk update and emit graphStyleChanged once at the end
+        blocked = [widget.blockSignals(True) for widget in self._styleWidgets]
+        try:
+            for style in self.styles:
+                setter = self._setters.get(style, None)
+                if setter is not None:
+                    setter(graphStyle)
+        finally:
+            for widget, wasBlocked in zip(self._styleWidgets, blocked):
+                widget.blockSignals(wasBlocked)
+        self.graphStyleChanged.emit()
+    
+    # per style handlers used by graphStyle/setGraphStyle --------------------
+    
+    def _getColor(self, graphStyle: GraphStyle):
+        color = self.colorButton.color()
+        if color is not None:
+            graphStyle.setColor(color)
+    
+    def _setColor(self, graphStyle: GraphStyle):
+        color = graphStyle.color()
+        self.colorButton.setColor(color)
+    
+    def _getLineStyle(self, graphStyle: GraphStyle):
+        key = self.lineStyleComboBox.currentText()
+        lineStyle = _LINESTYLE_LABELS[key]
+        graphStyle.setLineStyle(lineStyle)
+    
+    def _setLineStyle(self, graphStyle: GraphStyle):
+        lineStyle = graphStyle.lineStyle()
+        lineStyle = _LINESTYLE_LABEL_LOOKUP.get(lineStyle.lower(), lineStyle)
+        self.lineStyleComboBox.setCurrentText(lineStyle)
+    
+    def _getLineWidth(self, graphStyle: GraphStyle):
+        lineWidth = self.lineWidthSpinBox.value()
+        graphStyle.setLineWidth(lineWidth)
+    
+    def _setLineWidth(self, graphStyle: GraphStyle):
+        lineWidth = graphStyle.lineWidth()
+        self.lineWidthSpinBox.setValue(lineWidth)
+    
+    def _getMarker(self, graphStyle: GraphStyle):
+        marker = self.markerComboBox.currentText().lower()
+        graphStyle.setMarker(marker)
+    
+    def _setMarker(self, graphStyle: GraphStyle):
+        marker = graphStyle.marker()
+        index = self._markerIndexByLabel.get(marker.lower(), None)
+        if index is not None:
+            self.markerComboBox.setCurrentIndex(index)
+    
+    def _getMarkerSize(self, graphStyle: GraphStyle):
+        markerSize = self.markerSizeSpinBox.value()
+        graphStyle.setMarkerSize(markerSize)
+    
+    def _setMarkerSize(self, graphStyle: GraphStyle):
+        markerSize = graphStyle.markerSize()
+        self.markerSizeSpinBox.setValue(markerSize)
+    
+    def _getMarkerEdgeStyle(self, graphStyle: GraphStyle):
+        key = self.markerEdgeStyleComboBox.currentText()
+        markerEdgeStyle = _LINESTYLE_LABELS[key]
+        graphStyle.setMarkerEdgeStyle(markerEdgeStyle)
+    
+    def _setMarkerEdgeStyle(self, graphStyle: GraphStyle):
+        markerEdgeStyle = graphStyle.markerEdgeStyle()
+        markerEdgeStyle = _LINESTYLE_LABEL_LOOKUP.get(markerEdgeStyle.lower(), markerEdgeStyle)
+        self.markerEdgeStyleComboBox.setCurrentText(markerEdgeStyle)
+    
+    def _getMarkerEdgeWidth(self, graphStyle: GraphStyle):
+        markerEdgeWidth = self.markerEdgeWidthSpinBox.value()
+        graphStyle.setMarkerEdgeWidth(markerEdgeWidth)
+    
+    def _setMarkerEdgeWidth(self, graphStyle: GraphStyle):
+        markerEdgeWidth = graphStyle.markerEdgeWidth()
+        self.markerEdgeWidthSpinBox.setValue(markerEdgeWidth)
+    
+    def _getMarkerEdgeColor(self, graphStyle: GraphStyle):
+        markerEdgeColor = self.markerEdgeColorButton.color()
+        if markerEdgeColor is not None:
+            graphStyle.setMarkerEdgeColor(markerEdgeColor)
+    
+    def _setMarkerEdgeColor(self, graphStyle: GraphStyle):
+        markerEdgeColor = graphStyle.markerEdgeColor()
+        self.markerEdgeColorButton.setColor(markerEdgeColor)
+    
+    def _getMarkerFaceColor(self, graphStyle: GraphStyle):
+        markerFaceColor = self.markerFaceColorButton.color()
+        if markerFaceColor is not None:
+            graphStyle.setMarkerFaceColor(markerFaceColor)
+    
+    def _setMarkerFaceColor(self, graphStyle: GraphStyle):
+        markerFaceColor = graphStyle.markerFaceColor()
+        self.markerFaceColorButton.setColor(markerFaceColor)
 
 
 def editGraphStyle(graphStyle: GraphStyle, styles: list[str] = None, parent: QWidget = None, title: str = None) -> GraphStyle | None:
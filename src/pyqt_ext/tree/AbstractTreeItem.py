@@ -4,6 +4,11 @@
 from __future__ import annotations
 from typing import Callable
 from collections.abc import Iterator
+import numpy as np
+
+
+# tree linkage and caches that are rebuilt rather than copied (see AbstractTreeItem.__getstate__)
+_UNCOPIED_SLOTS = frozenset(['_parent', '__weakref__', '_sibling_index', '_depth', '_path', '_path_revision', '_child_index', '_child_index_revision'])
 
 
 class AbstractTreeItem():
@@ -27,11 +32,26 @@ class AbstractTreeItem():
         2. Minimally reimplement `get_data` and `set_data` methods (used by AbstractTreeModel).
         3. For nice printout, you may want to reimplement `__repr__`.
         4. For special linkage rules you may need to reimplement `parent.setter` and `insert_child`.
+        5. If you reimplement the `name` property (e.g., to derive it from your data),
+           call `invalidate_caches` whenever the name changes.
+           Paths and path-based item access are cached, and only name.setter invalidates them automatically.
     """
+
+    __slots__ = ('_name', '_parent', 'children', '_sibling_index', '_path', '_path_revision', '_child_index', '_child_index_revision', '_depth', '__weakref__')
+
+    # Incremented on any change to tree structure or item names.
+    # Cached values stamped with an older revision are stale.
+    _revision: int = 0
     
     def __init__(self, name: str | None = None, parent: AbstractTreeItem | None = None) -> None:
         self._name: str | None = name
         self._parent: AbstractTreeItem | None = None
+        self._sibling_index: int = -1  # position in parent.children (maintained by parent.setter and insert_child)
+        self._depth: int = 0  # number of ancestors (maintained by parent.setter)
+        self._path: str | None = None
+        self._path_revision: int = -1
+        self._child_index: dict[str, AbstractTreeItem] = {}
+        self._child_index_revision: int = -1
         self.children: list[AbstractTreeItem] = []
         if parent is not None:
             self.parent = parent
@@ -50,6 +70,33 @@ class AbstractTreeItem():
         """
         return self._tree_repr(lambda item: item.name)
     
+    def __getstate__(self) -> dict:
+        """ State for copy.deepcopy and pickle.
+
+        The parent reference and cached tree info are not part of the state,
+        they are restored from the children lists in __setstate__.
+        So a copied/unpickled item is the root of its own tree.
+        """
+        state: dict = {}
+        for cls in type(self).__mro__:
+            for slot in getattr(cls, '__slots__', ()):
+                if (slot not in _UNCOPIED_SLOTS) and hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        state.update(getattr(self, '__dict__', {}))
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        AbstractTreeItem.__init__(self)
+        for key, value in state.items():
+            setattr(self, key, value)
+        self.children = list(self.children)
+        for i, child in enumerate(self.children):
+            if child.parent is None:
+                # newly copied/unpickled child (a shallow copy shares its children with the original, leave them be)
+                child._parent = self
+                child._sibling_index = i
+                child._update_branch_caches()
+    
     def __getitem__(self, path: str) -> AbstractTreeItem:
         """ Return item at path either from the root item (if path starts with /) or otherwise from this item.
         """
@@ -61,15 +108,33 @@ class AbstractTreeItem():
             item: AbstractTreeItem = self
         path = path.strip('/').split('/')
         for name in path:
-            try:
-                child_names = [child.name for child in item.children]
-                child_index = child_names.index(name)
-                item = item.children[child_index]
-            except Exception as error:
-                print(error)
+            item = item._child_by_name(name)
+            if item is None:
                 return None
         return item
     
+    def invalidate_caches(self) -> None:
+        """ Mark cached paths and child name lookups as stale for all items.
+
+        Called automatically on restructuring and by name.setter.
+        Call this yourself if an item's name can change any other way (e.g., a name derived from data).
+        """
+        AbstractTreeItem._revision += 1
+    
+    def _child_by_name(self, name: str) -> AbstractTreeItem | None:
+        """ Return the first child with name, or None.
+
+        Uses a name -> child lookup that is rebuilt only after the tree has changed (see invalidate_caches).
+        """
+        if self._child_index_revision != AbstractTreeItem._revision:
+            child_index: dict[str, AbstractTreeItem] = {}
+            for child in self.children:
+                # first child with a given name wins
+                child_index.setdefault(child.name, child)
+            self._child_index = child_index
+            self._child_index_revision = AbstractTreeItem._revision
+        return self._child_index.get(name)
+    
     def dumps(self) -> str:
         """ Returns a multi-line string representation of this item's tree branch.
 
@@ -83,22 +148,21 @@ class AbstractTreeItem():
         Each item is described by the single line str returned by func(item).
         See __str__ and dumps for examples.
         """
-        items: list[AbstractTreeItem] = list(self.depth_first())
-        lines: list[str] = [func(item) for item in items]
-        for i, item in enumerate(items):
-            if item is self:
-                continue
-            if item is item.parent.last_child:
-                lines[i] = '\u2514' + '\u2500'*2 + ' ' + lines[i]
-            else:
-                lines[i] = '\u251C' + '\u2500'*2 + ' ' + lines[i]
-            parent = item.parent
-            while parent is not self:
-                if i < items.index(parent.parent.last_child):
-                    lines[i] = '\u2502' + ' '*3 + lines[i]
-                else:
-                    lines[i] = ' '*4 + lines[i]
-                parent = parent.parent
+        lines: list[str] = [func(self)]
+        # depth-first stack of (item, line prefix, is last child),
+        # each child's prefix is built once from its parent's prefix
+        stack: list[tuple[AbstractTreeItem, str, bool]] = []
+        item: AbstractTreeItem = self
+        prefix: str = ''
+        while True:
+            if item.children:
+                last_child: AbstractTreeItem = item.children[-1]
+                stack.extend([(child, prefix, child is last_child) for child in reversed(item.children)])
+            if not stack:
+                break
+            item, prefix, is_last = stack.pop()
+            lines.append(prefix + ('\u2514' if is_last else '\u251C') + '\u2500'*2 + ' ' + func(item))
+            prefix += ' '*4 if is_last else '\u2502' + ' '*3
         return '\n'.join(lines)
     
     @property
@@ -117,17 +181,50 @@ class AbstractTreeItem():
         if self.parent is parent:
             # nothing to do
             return
-        if (parent is not None) and parent.has_ancestor(self):
+        if not self._check_ancestry(parent):
             raise ValueError('Cannot set parent to a descendant.')
-        if self.parent is not None:
-            # detach from old parent
-            if self in self.parent.children:
-                self.parent.children.remove(self)
+        self._reparent(parent)
+    
+    def _check_ancestry(self, parent: AbstractTreeItem | None) -> bool:
+        """ Return False if parent is this item or one of its descendants.
+        """
+        return (parent is None) or not parent.has_ancestor(self)
+    
+    def _reparent(self, parent: AbstractTreeItem | None) -> None:
+        """ Move this item to be the last child of parent without any validity checks.
+        """
+        old_parent: AbstractTreeItem | None = self.parent
+        if old_parent is not None:
+            # detach from old parent (by position, no search)
+            pos: int = self.sibling_index
+            del old_parent.children[pos]
+            old_parent._update_sibling_indexes(pos)
+            # drop the stale name lookup so it does not keep this item alive
+            old_parent._child_index = {}
+            old_parent._child_index_revision = -1
         if parent is not None:
             # attach to new parent (appends as last child)
-            if self not in parent.children:
-                parent.children.append(self)
+            # not yet a child of parent, as parent is not the current parent (checked above)
+            parent.children.append(self)
+            self._sibling_index = len(parent.children) - 1
+        else:
+            self._sibling_index = -1
         self._parent = parent
+        self._update_branch_caches()
+    
+    def _update_branch_caches(self) -> None:
+        """ Update cached tree info after this item's branch has been attached to a new parent.
+
+        All per-item caches of the branch are refreshed in a single pass.
+        Paths and child name lookups anywhere in the tree are invalidated by bumping the revision counter, which needs no pass at all.
+        """
+        self.invalidate_caches()
+        depth_shift: int = (0 if self.parent is None else self.parent._depth + 1) - self._depth
+        if depth_shift == 0:
+            # branch depths are unchanged
+            return
+        for item in self.depth_first():
+            item._depth += depth_shift
     
     @property
     def name(self) -> str:
@@ -141,19 +238,33 @@ class AbstractTreeItem():
     @name.setter
     def name(self, name: str) -> None:
         self._name = name
+        self.invalidate_caches()
     
     @property
     def path(self) -> str:
         """ Return the /path/to/this/item from the root item.
 
         Path is constructed from item names separated by /.
+        Cached until the tree structure or any item name changes.
         """
-        item: AbstractTreeItem = self
-        path = []
-        while not item.is_root():
-            path.insert(0, item.name)
+        revision: int = AbstractTreeItem._revision
+        if self._path_revision == revision:
+            return self._path
+        # collect items up to the nearest ancestor with a valid cached path
+        items: list[AbstractTreeItem] = []
+        item: AbstractTreeItem | None = self
+        while (item is not None) and (item._path_revision != revision):
+            items.append(item)
             item = item.parent
-        return '/' + '/'.join(path)
+        path: str = '' if (item is None) or (item.parent is None) else item._path
+        for item in reversed(items):
+            if item.parent is None:
+                item._path = '/'
+            else:
+                path += '/' + str(item.name)
+                item._path = path
+            item._path_revision = revision
+        return self._path
     
     @property
     def root(self) -> AbstractTreeItem:
@@ -199,43 +310,62 @@ class AbstractTreeItem():
     #         return self.parent.last_child
     #     return self
 
+    @property
+    def _sibling_list(self) -> list[AbstractTreeItem] | None:
+        """ The parent's children list itself (not a copy, do not modify), or None for a root item.
+        """
+        parent: AbstractTreeItem | None = self.parent
+        if parent is not None:
+            return parent.children
+
     @property
     def next_sibling(self) -> AbstractTreeItem | None:
-        if self.parent is not None:
-            siblings: list[AbstractTreeItem] = self.parent.children
-            i: int = siblings.index(self)
+        siblings: list[AbstractTreeItem] | None = self._sibling_list
+        if siblings is not None:
+            i: int = self._index_in(siblings)
             if i+1 < len(siblings):
                 return siblings[i+1]
 
     @property
     def prev_sibling(self) -> AbstractTreeItem | None:
-        if self.parent is not None:
-            siblings: list[AbstractTreeItem] = self.parent.children
-            i: int = siblings.index(self)
+        siblings: list[AbstractTreeItem] | None = self._sibling_list
+        if siblings is not None:
+            i: int = self._index_in(siblings)
             if i-1 >= 0:
                 return siblings[i-1]
 
     @property
     def sibling_index(self) -> int:
-        if self.parent is None:
+        siblings: list[AbstractTreeItem] | None = self._sibling_list
+        if siblings is None:
             return 0
-        return self.parent.children.index(self)
+        return self._index_in(siblings)
+    
+    def _index_in(self, siblings: list[AbstractTreeItem]) -> int:
+        """ Return this item's position in its sibling list (from the cached sibling index).
+        """
+        i: int = self._sibling_index
+        if not ((0 <= i < len(siblings)) and (siblings[i] is self)):
+            # cached index is stale (e.g., children list was modified directly)
+            i = self._sibling_index = siblings.index(self)
+        return i
+    
+    def _update_sibling_indexes(self, start: int = 0, stop: int | None = None) -> None:
+        """ Refresh the cached sibling index of children[start:stop].
+        """
+        children: list[AbstractTreeItem] = self.children
+        if stop is None:
+            stop = len(children)
+        for i in range(start, stop):
+            children[i]._sibling_index = i
     
     def depth(self, root: AbstractTreeItem = None) -> int:
-        depth: int = 0
-        item: AbstractTreeItem = self
-        while (item.parent is not None) and (item is not root):
-            depth += 1
-            item = item.parent
-        return depth
+        if (root is not None) and self.has_ancestor(root):
+            return self._depth - root._depth
+        return self._depth
     
     def branch_max_depth(self) -> int:
-        max_depth: int = 0
-        for item in self.depth_first():
-            depth: int = item.depth(self)
-            if depth > max_depth:
-                max_depth = depth
-        return max_depth
+        return max(item._depth for item in self.depth_first()) - self._depth
     
     def is_root(self) -> bool:
         return self.parent is None
@@ -244,31 +374,50 @@ class AbstractTreeItem():
         return not self.children
     
     def has_ancestor(self, ancestor: AbstractTreeItem) -> bool:
+        if ancestor is None:
+            return False
+        # an ancestor can only be exactly (depth difference) steps up the tree
+        steps: int = self._depth - ancestor._depth
+        if steps < 0:
+            return False
         item: AbstractTreeItem = self
-        while item is not None:
-            if item is ancestor:
-                return True
+        for _ in range(steps):
             item = item.parent
-        return False
+        return item is ancestor
 
-    def set_parent(self, parent: AbstractTreeItem) -> None:
+    def set_parent(self, parent: AbstractTreeItem) -> bool:
+        """ Returns False if parent is this item or one of its descendants.
+        """
+        if not self._check_ancestry(parent):
+            return False
         self.parent = parent
+        return True
     
-    def append_child(self, child: AbstractTreeItem) -> None:
-        child.parent = self
+    def append_child(self, child: AbstractTreeItem) -> bool:
+        return child.set_parent(self)
     
-    def insert_child(self, index: int, child: AbstractTreeItem) -> None:
+    def insert_child(self, index: int, child: AbstractTreeItem) -> bool:
+        """ Returns False if child is this item or one of its ancestors.
+        """
         if not (0 <= index <= len(self.children)):
             raise IndexError('Index out of range.')
-        # append as last child
-        child.parent = self
+        if not child._check_ancestry(self):
+            return False
+        if child.parent is self:
+            pos = child.sibling_index
+        else:
+            # append as last child
+            child.parent = self
+            pos = len(self.children) - 1
         # move item to index
-        pos = self.children.index(child)
         if pos != index:
             if pos < index:
                 index -= 1
             if pos != index:
                 self.children.insert(index, self.children.pop(pos))
+                self._update_sibling_indexes(min(pos, index), max(pos, index) + 1)
+                self.invalidate_caches()
+        return True
     
     def remove_child(self, child: AbstractTreeItem) -> None:
         if child.parent is not self:
@@ -278,18 +427,24 @@ class AbstractTreeItem():
     # depth-first iteration --------------------------------------------------
     
     def depth_first(self) -> Iterator[AbstractTreeItem]:
-        item: AbstractTreeItem = self
-        end_item: AbstractTreeItem | None = self._last_depth_first()._next_depth_first()
-        while item is not end_item:
+        # explicit stack: one pass with no sibling lookups
+        stack: list[AbstractTreeItem] = [self]
+        while stack:
+            item: AbstractTreeItem = stack.pop()
             yield item
-            item = item._next_depth_first()
+            if item.children:
+                stack.extend(reversed(item.children))
     
     def reverse_depth_first(self) -> Iterator[AbstractTreeItem]:
-        item: AbstractTreeItem = self._last_depth_first()
-        end_item: AbstractTreeItem | None = self._prev_depth_first()
-        while item is not end_item:
-            yield item
-            item = item._prev_depth_first()
+        # an item is yielded after its children have been visited last-to-first
+        stack: list[tuple[AbstractTreeItem, bool]] = [(self, False)]
+        while stack:
+            item, visited = stack.pop()
+            if visited or not item.children:
+                yield item
+                continue
+            stack.append((item, True))
+            stack.extend([(child, False) for child in item.children])
     
     def _next_depth_first(self) -> AbstractTreeItem | None:
         if self.children:
@@ -322,18 +477,14 @@ class AbstractTreeItem():
     # leaf iteration --------------------------------------------------
     
     def leaves(self) -> Iterator[AbstractTreeItem]:
-        item: AbstractTreeItem = self._first_leaf()
-        end_item: AbstractTreeItem | None = self._last_leaf()._next_leaf()
-        while item is not end_item:
-            yield item
-            item = item._next_leaf()
+        for item in self.depth_first():
+            if not item.children:
+                yield item
     
     def reverse_leaves(self) -> Iterator[AbstractTreeItem]:
-        item: AbstractTreeItem = self._last_leaf()
-        end_item: AbstractTreeItem | None = self._first_leaf()._prev_leaf()
-        while item is not end_item:
-            yield item
-            item = item._prev_leaf()
+        for item in self.reverse_depth_first():
+            if not item.children:
+                yield item
     
     def _next_leaf(self) -> AbstractTreeItem | None:
         try:
@@ -359,6 +510,41 @@ class AbstractTreeItem():
             item = item.last_child
         return item
 
+    # flat array view --------------------------------------------------
+    
+    def flatten(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """ Return a flat array representation of this item's tree branch.
+
+        Index i in each array refers to the i-th item of depth_first() (this item is index 0).
+        Returns (parent_idx, depths, first_child, next_sibling) as int32 arrays,
+        where depths are relative to this item and -1 indicates no such item.
+        Useful for bulk numpy analysis of large trees.
+        """
+        items: list[AbstractTreeItem] = list(self.depth_first())
+        n: int = len(items)
+        parent_idx: np.ndarray = np.full(n, -1, dtype=np.int32)
+        depths: np.ndarray = np.empty(n, dtype=np.int32)
+        first_child: np.ndarray = np.full(n, -1, dtype=np.int32)
+        next_sibling: np.ndarray = np.full(n, -1, dtype=np.int32)
+        index: dict[int, int] = {}
+        root_depth: int = self._depth
+        for i, item in enumerate(items):
+            index[id(item)] = i
+            depths[i] = item._depth - root_depth
+            if item is not self:
+                parent_idx[i] = index[id(item.parent)]
+            if item.children:
+                # in depth-first order the first child immediately follows its parent
+                first_child[i] = i + 1
+        for i, item in enumerate(items):
+            prev: int = -1
+            for child in item.children:
+                j: int = index[id(child)]
+                if prev >= 0:
+                    next_sibling[prev] = j
+                prev = j
+        return parent_idx, depths, first_child, next_sibling
+
     # interface for QAbstractItemModel ----------------------------------------
     
     def get_data(self, column: int):
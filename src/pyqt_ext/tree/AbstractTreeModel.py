@@ -8,6 +8,11 @@ from qtpy.QtWidgets import *
 from pyqt_ext.tree import AbstractTreeItem
 
 
+# precomputed item flags (flags() is called for every visible index on each repaint)
+_ITEM_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+_DND_ITEM_FLAGS = _ITEM_FLAGS | Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled
+
+
 class AbstractTreeModel(QAbstractItemModel):
     """ Base class for a tree model that uses AbstractTreeItem for its data interface.
 
@@ -145,16 +150,16 @@ class AbstractTreeModel(QAbstractItemModel):
         
         Supports drag-and-drop if it is enabled in `supportedDropActions`.
         """
+        is_dnd: bool = self.supportedDropActions() != Qt.DropAction.IgnoreAction
         if not index.isValid():
             # root item
-            if self.supportedDropActions() != Qt.DropAction.IgnoreAction:
+            if is_dnd:
                 # allow drops on the root item (i.e., this allows drops on the viewport away from other items)
                 return Qt.ItemFlag.ItemIsDropEnabled
             return Qt.ItemFlag.NoItemFlags
-        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
-        if self.supportedDropActions() != Qt.DropAction.IgnoreAction:
-            flags |= Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled
-        return flags
+        if is_dnd:
+            return _DND_ITEM_FLAGS
+        return _ITEM_FLAGS
 
     def data(self, index: QModelIndex, role: int):
         """ Get data via `AbstractTreeItem.get_data`.
@@ -176,6 +181,7 @@ class AbstractTreeModel(QAbstractItemModel):
         if role == Qt.ItemDataRole.EditRole:
             success: bool = item.set_data(index.column(), value)
             if success:
+                # no role filter, as a derived item's set_data may affect any role (decoration, check state, etc.)
                 self.dataChanged.emit(index, index)
             return success
         return False
@@ -2,24 +2,28 @@
 """
 
 from __future__ import annotations
+from collections.abc import Container
 from pyqt_ext.tree import AbstractTreeItem
 
 
 class KeyValueTreeItem(AbstractTreeItem):
+
+    __slots__ = ('_key', '_value', '_is_dict', '_is_list')
     
-    def __init__(self, key: str | None, value, parent: KeyValueTreeItem | None = None) -> None:
+    def __init__(self, key: str | None, value, parent: KeyValueTreeItem | None = None, _link_only: bool = False) -> None:
         self._key: str | None = key
         self._value = value
+        self._update_value_type()
+        if _link_only:
+            # value already lives in the parent container (see _build_subtree),
+            # so only link the item into the tree without syncing the data or building a subtree
+            AbstractTreeItem.__init__(self)
+            AbstractTreeItem.parent.fset(self, parent)
+            return
         AbstractTreeItem.__init__(self, parent=parent)
 
-        # recursively build subtree if value is itself a container with key,value access
-        if isinstance(value, dict):
-            for key in value:
-                KeyValueTreeItem(key, value[key], parent=self)
-        elif isinstance(value, list):
-            for i in range(len(value)):
-                # list keys are not explicitly set, they will default to the list index
-                KeyValueTreeItem(None, value[i], parent=self)
+        # build subtree if value is itself a container with key,value access
+        self._build_subtree()
     
     def __repr__(self):
         if self.is_container():
@@ -29,9 +33,9 @@ class KeyValueTreeItem(AbstractTreeItem):
     @property
     def key(self) -> str | int:
         # if parent is a list, the key is the index of this item in the list
-        if self.parent is not None:
-            if self.parent.is_list():
-                return self.sibling_index
+        parent: KeyValueTreeItem | None = self.parent
+        if (parent is not None) and parent.is_list():
+            return self.sibling_index
         # otherwise, return the local key
         return self._key
     
@@ -47,7 +51,7 @@ class KeyValueTreeItem(AbstractTreeItem):
                     self.parent.value.pop(self.key)
                 # make sure key is unique
                 if key in self.parent.value:
-                    key = unique_name(key, list(self.parent.value.keys()))
+                    key = unique_name(key, self.parent.value)
                 # add new key to parent dict
                 self.parent.value[key] = self.value
             elif self.parent.is_list():
@@ -55,6 +59,7 @@ class KeyValueTreeItem(AbstractTreeItem):
                 return
         # update local key
         self._key = key
+        self.invalidate_caches()
     
     @property
     def value(self):
@@ -73,15 +78,10 @@ class KeyValueTreeItem(AbstractTreeItem):
                 self.parent.value[self.key] = value
         # update local value
         self._value = value
+        self._update_value_type()
 
-        # recursively build subtree if value is itself a container with key,value access
-        if isinstance(value, dict):
-            for key in value:
-                KeyValueTreeItem(key, value[key], parent=self)
-        elif isinstance(value, list):
-            for i in range(len(value)):
-                # list keys are not explicitly set, they will default to the list index
-                KeyValueTreeItem(None, value[i], parent=self)
+        # build subtree if value is itself a container with key,value access
+        self._build_subtree()
     
     @AbstractTreeItem.parent.setter
     def parent(self, parent: KeyValueTreeItem | None) -> None:
@@ -127,18 +127,49 @@ class KeyValueTreeItem(AbstractTreeItem):
         return str(self.key)
     
     def is_dict(self):
-        return isinstance(self.value, dict)
+        return self._is_dict
     
     def is_list(self):
-        return isinstance(self.value, list)
+        return self._is_list
     
     def is_container(self):
-        return self.is_dict() or self.is_list()
+        return self._is_dict or self._is_list
+    
+    def _update_value_type(self) -> None:
+        # cached container type (only changes when value is reassigned)
+        self._is_dict: bool = isinstance(self._value, dict)
+        self._is_list: bool = isinstance(self._value, list)
+    
+    def _build_subtree(self) -> None:
+        """ Create child items for all nested dict/list values.
+
+        Iterative (explicit stack) so deeply nested data does not recurse.
+        """
+        stack: list[KeyValueTreeItem] = [self]
+        while stack:
+            item: KeyValueTreeItem = stack.pop()
+            if item.is_dict():
+                entries = item._value.items()
+            elif item.is_list():
+                # list keys are not explicitly set, they will default to the list index
+                entries = ((None, value) for value in item._value)
+            else:
+                continue
+            for key, value in entries:
+                stack.append(item._new_subtree_item(key, value, item))
+    
+    @classmethod
+    def _new_subtree_item(cls, key: str | None, value, parent: KeyValueTreeItem) -> KeyValueTreeItem:
+        """ Create a child item for a value that already lives in parent's container.
+
+        Reimplement if a derived class's constructor takes different arguments.
+        """
+        return cls(key, value, parent, _link_only=True)
     
     def ensure_unique_key(self):
         if self.parent is None:
             return
-        keys = [sibling.key for sibling in self.parent.children if sibling is not self]
+        keys = {sibling.key for sibling in self.parent.children if sibling is not self}
         if self.key in keys:
             self.key = unique_name(self.key, keys)
     
@@ -159,15 +190,21 @@ class KeyValueTreeItem(AbstractTreeItem):
     
     def set_data(self, column: int, value) -> bool:
         if column == 0:
+            if value == self._key:
+                # no change (e.g., editor closed without any edits)
+                return False
             self.key = value
             return True
         elif column == 1:
+            if (type(value) is type(self._value)) and (type(value) in (str, int, float, bool)) and (value == self._value):
+                # no change
+                return False
             self.value = value
             return True
         return False
 
 
-def unique_name(name: str, names: list[str]) -> str:
+def unique_name(name: str, names: Container[str]) -> str:
     if name not in names:
         return name
     i: int = 1
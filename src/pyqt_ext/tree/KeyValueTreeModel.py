@@ -6,13 +6,23 @@ from qtpy.QtCore import *
 from qtpy.QtGui import *
 from qtpy.QtWidgets import *
 from pyqt_ext.tree import AbstractTreeModel, KeyValueTreeItem
+from pyqt_ext.tree.AbstractTreeModel import _ITEM_FLAGS
 import qtawesome as qta
 
 
+# only containers accept drops
+_DND_VALUE_FLAGS = _ITEM_FLAGS | Qt.ItemFlag.ItemIsDragEnabled
+_DND_CONTAINER_FLAGS = _DND_VALUE_FLAGS | Qt.ItemFlag.ItemIsDropEnabled
+
+
 class KeyValueTreeModel(AbstractTreeModel):
 
     sigKeyChanged = Signal()
     sigValueChanged = Signal()
+
+    # decoration icons (created on first use, requires a QApplication)
+    _dictIcon: QIcon | None = None
+    _listIcon: QIcon | None = None
     
     def __init__(self, root: KeyValueTreeItem = None, parent: QObject = None):
         AbstractTreeModel.__init__(self, root, parent)
@@ -22,25 +32,25 @@ class KeyValueTreeModel(AbstractTreeModel):
         return 2
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        is_dnd: bool = self.supportedDropActions() != Qt.DropAction.IgnoreAction
         if not index.isValid():
-            if self.supportedDropActions() != Qt.DropAction.IgnoreAction:
+            if is_dnd:
                 # allow drops on the root item (i.e., this allows drops on the viewport away from other items)
                 return Qt.ItemFlag.ItemIsDropEnabled
             return Qt.ItemFlag.NoItemFlags
-        item: KeyValueTreeItem = self.itemFromIndex(index)
         # if (index.column() == 1) and item.is_container():
         #     # cannot edit container value, only the values of items inside it
         #     flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
         # else:
-        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
-        if self.supportedDropActions() != Qt.DropAction.IgnoreAction:
-            flags |= Qt.ItemFlag.ItemIsDragEnabled
-            if item.is_container():
-                flags |= Qt.ItemFlag.ItemIsDropEnabled
+        if not is_dnd:
+            return _ITEM_FLAGS
+        item: KeyValueTreeItem = self.itemFromIndex(index)
+        if item.is_container():
+            return _DND_CONTAINER_FLAGS
         # data = self.data(index, Qt.ItemDataRole.DisplayRole)
         # if isinstance(data, bool):
         #     flags |= Qt.ItemFlag.ItemIsUserCheckable
-        return flags
+        return _DND_VALUE_FLAGS
 
     def data(self, index: QModelIndex, role: int):
         if not index.isValid():
@@ -55,15 +65,32 @@ class KeyValueTreeModel(AbstractTreeModel):
         elif role == Qt.ItemDataRole.DecorationRole:
             if index.column() == 0:
                 if item.is_dict():
-                    return qta.icon('ph.folder-thin')
+                    if KeyValueTreeModel._dictIcon is None:
+                        KeyValueTreeModel._dictIcon = qta.icon('ph.folder-thin')
+                    return KeyValueTreeModel._dictIcon
                 if item.is_list():
-                    return qta.icon('ph.list-numbers-thin')
+                    if KeyValueTreeModel._listIcon is None:
+                        KeyValueTreeModel._listIcon = qta.icon('ph.list-numbers-thin')
+                    return KeyValueTreeModel._listIcon
 
     def setData(self, index: QModelIndex, value, role: int) -> bool:
         item: KeyValueTreeItem = self.itemFromIndex(index)
         if role == Qt.ItemDataRole.EditRole:
-            success: bool = item.set_data(index.column(), value)
+            # setting a container value (or replacing one) rebuilds the item's children
+            # and changes its icon and flags, so views need a full reset
+            is_structural: bool = (index.column() == 1) and (item.is_container() or isinstance(value, (dict, list)))
+            if is_structural:
+                self.beginResetModel()
+                try:
+                    success: bool = item.set_data(index.column(), value)
+                finally:
+                    self.endResetModel()
+            else:
+                success: bool = item.set_data(index.column(), value)
             if success:
+                if not is_structural:
+                    # bounded update of the edited cell
+                    self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
                 if index.column() == 0:
                     self.sigKeyChanged.emit()
                 elif index.column() == 1:
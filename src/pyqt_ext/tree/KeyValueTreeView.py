@@ -49,19 +49,9 @@ class KeyValueTreeViewDelegate(QStyledItemDelegate):
     
     def createEditor(self, parent, option, index):
         data = index.model().data(index, Qt.ItemDataRole.EditRole)
-        if type(data) in [int, float, bool, str]:
+        if (type(data) in [int, float, bool, str]) or isinstance(data, (tuple, list)):
             editor = QLineEdit(parent)
-            editor.setText(str(data))
-            return editor
-        elif isinstance(data, tuple):
-            editor = QLineEdit(parent)
-            text = '(' + ', '.join(str(value) for value in data) + ')'
-            editor.setText(text)
-            return editor
-        elif isinstance(data, list):
-            editor = QLineEdit(parent)
-            text = '[' + ', '.join(str(value) for value in data) + ']'
-            editor.setText(text)
+            editor.setText(value_to_str(data))
             return editor
         # elif isinstance(data, bool):
         #     # will handle with paint(), editorEvent(), and setModelData()
@@ -71,12 +61,10 @@ class KeyValueTreeViewDelegate(QStyledItemDelegate):
     def paint(self, painter, option, index):
         data = index.model().data(index, Qt.ItemDataRole.DisplayRole)
         if type(data) in [tuple, list, bool]:
-            if isinstance(data, tuple):
-                text = '(' + ', '.join(str(value) for value in data) + ')'
-            elif isinstance(data, list):
-                text = '[' + ', '.join(str(value) for value in data) + ']'
-            elif isinstance(data, bool):
+            if isinstance(data, bool):
                 text = ' ' + str(data)
+            else:
+                text = value_to_str(data)
             if option.state & QStyle.State_Selected:
                 painter.fillRect(option.rect, option.palette.highlight())
                 painter.setPen(option.palette.highlightedText().color())
@@ -127,10 +115,15 @@ class KeyValueTreeViewDelegate(QStyledItemDelegate):
                 return
         if isinstance(editor, QLineEdit):
             value = str_to_value(editor.text())
+            # the model resets itself when a container value is set or replaced,
+            # so keep the view's expanded/selected state across the edit
+            is_structural: bool = type(value) in [dict, list] or type(data) in [dict, list]
+            view: KeyValueTreeView = self.parent()
+            if is_structural:
+                view.storeState()
             model.setData(index, value, Qt.ItemDataRole.EditRole)
-            if type(value) in [dict, list] or type(data) in [dict, list]:
-                view: KeyValueTreeView = self.parent()
-                view.resetModel()
+            if is_structural:
+                view.restoreState()
             return
         # elif isinstance(data, bool):
         #     checked = not data
@@ -154,20 +147,34 @@ class KeyValueTreeViewDelegate(QStyledItemDelegate):
         return QRect(checkBoxTopLeftCorner, checkBoxRect.size())
 
 
+def value_to_str(value) -> str:
+    """ Inverse of str_to_value for values edited as text.
+    """
+    if isinstance(value, tuple):
+        return '(' + ', '.join(map(str, value)) + ')'
+    if isinstance(value, list):
+        return '[' + ', '.join(map(str, value)) + ']'
+    return str(value)
+
+
 def str_to_value(text: str) -> bool | int | float | str | tuple | list | dict:
-    if text.lower().strip() == 'true':
+    # strip/lower once up front rather than on every check
+    stripped: str = text.strip()
+    lowered: str = stripped.lower()
+    if lowered == 'true':
         return True
-    if text.lower().strip() == 'false':
+    if lowered == 'false':
         return False
-    if text.lstrip().startswith('(') and text.rstrip().endswith(')'):
-        return tuple([str_to_value(item.strip()) for item in text.strip()[1:-1].split(',') if item.strip() != ''])
-    if text.lstrip().startswith('[') and text.rstrip().endswith(']'):
-        return [str_to_value(item.strip()) for item in text.strip()[1:-1].split(',') if item.strip() != '']
-    if text.lstrip().startswith('{') and text.rstrip().endswith('}'):
+    if stripped.startswith('(') and stripped.endswith(')'):
+        return tuple([str_to_value(item) for item in map(str.strip, stripped[1:-1].split(',')) if item])
+    if stripped.startswith('[') and stripped.endswith(']'):
+        return [str_to_value(item) for item in map(str.strip, stripped[1:-1].split(',')) if item]
+    if stripped.startswith('{') and stripped.endswith('}'):
         values = {}
-        for field in [item for item in text.strip()[1:-1].split(',') if ':' in item]:
-            key, value = field.split(':')
-            values[key.strip()] = str_to_value(value.strip())
+        for field in stripped[1:-1].split(','):
+            if ':' in field:
+                key, value = field.split(':')
+                values[key.strip()] = str_to_value(value.strip())
         return values
     try:
         return int(text)
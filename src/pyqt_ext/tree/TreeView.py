@@ -23,6 +23,10 @@ class TreeView(QTreeView):
         self.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
         # self.setAlternatingRowColors(True)
 
+        # all rows are single line text (+ icon), so skip per-row height queries during layout
+        # !!! turn this off in derived views whose delegates draw rows of varying height
+        self.setUniformRowHeights(True)
+
         # selection
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -55,12 +59,16 @@ class TreeView(QTreeView):
     
     def resetModel(self):
         self.storeState()
-        self.model().setRoot(self.model().root())
+        model: AbstractTreeModel = self.model()
+        model.setRoot(model.root())
         self.restoreState()
     
     @Slot(QItemSelection, QItemSelection)
     def selectionChanged(self, selected: QItemSelection, deselected: QItemSelection):
         QTreeView.selectionChanged(self, selected, deselected)
+        if selected.isEmpty() and deselected.isEmpty():
+            # nothing actually changed
+            return
         self.selectionWasChanged.emit()
 
     def selectedItems(self, column: int | None = 0) -> list[AbstractTreeItem]:
@@ -178,8 +186,33 @@ class TreeView(QTreeView):
             if answer != QMessageBox.StandardButton.Yes:
                 return
         model: AbstractTreeModel = self.model()
-        for item in reversed(items):
-            model.removeItem(item)
+        # group selected rows by parent,
+        # skipping items that will be removed along with a selected ancestor
+        selected: set[int] = {id(item) for item in items}
+        rows_by_parent: dict[int, tuple[AbstractTreeItem, list[int]]] = {}
+        for item in items:
+            parent: AbstractTreeItem | None = item.parent
+            if parent is None:
+                # cannot remove the root item
+                continue
+            ancestor: AbstractTreeItem | None = parent
+            while (ancestor is not None) and (id(ancestor) not in selected):
+                ancestor = ancestor.parent
+            if ancestor is not None:
+                continue
+            rows_by_parent.setdefault(id(parent), (parent, []))[1].append(item.sibling_index)
+        # remove contiguous blocks of rows, last to first so remaining rows stay valid
+        for parent, rows in rows_by_parent.values():
+            rows.sort(reverse=True)
+            last: int = rows[0]
+            first: int = last
+            for row in rows[1:] + [None]:
+                if row == first - 1:
+                    first = row
+                    continue
+                model.removeRows(first, last - first + 1, model.indexFromItem(parent))
+                if row is not None:
+                    first = last = row
     
     def eventFilter(self, obj: QObject, event: QEvent):
         if event.type() == QEvent.Wheel:
@@ -271,7 +304,8 @@ class TreeView(QTreeView):
         elif drop_pos == QAbstractItemView.DropIndicatorPosition.BelowItem:
             dst_row += 1
         
-        src_indices: list[QModelIndex] = [index for index in self.selectionModel().selectedIndexes() if index.column() == 0]
+        selectionModel: QItemSelectionModel = self.selectionModel()
+        src_indices: list[QModelIndex] = [index for index in selectionModel.selectedIndexes() if index.column() == 0]
 
         if event.dropAction() == Qt.DropAction.MoveAction:
             # move selected rows onto drop target
@@ -301,12 +335,13 @@ class TreeView(QTreeView):
             self.restoreState()
             
             # Make sure moved rows are selected.
-            self.selectionModel().clearSelection()
-            selection: QItemSelection = QItemSelection()
-            for row in range(dst_row, dst_row + num_moved):
-                index = model.index(row, 0, dst_parent_index)
-                selection.merge(QItemSelection(index, index), QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows)
-            self.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows)
+            # The moved rows are contiguous, so select them as a single range.
+            selectionModel.clearSelection()
+            if num_moved > 0:
+                first_index: QModelIndex = model.index(dst_row, 0, dst_parent_index)
+                last_index: QModelIndex = model.index(dst_row + num_moved - 1, 0, dst_parent_index)
+                selection: QItemSelection = QItemSelection(first_index, last_index)
+                selectionModel.select(selection, QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows)
 
         # clear persisting drop indicator !?
         self.setDropIndicatorShown(False)
@@ -325,15 +360,17 @@ class TreeView(QTreeView):
             return
         if not hasattr(self, '_state'):
             self._state = {}
-        selected: list[QModelIndex] = self.selectionModel().selectedIndexes()
-        for item in model.root().depth_first():
-            if item is model.root():
+        # identity set of selected items for O(1) lookup
+        selected: set[int] = {id(item) for item in self.selectedItems()}
+        root: AbstractTreeItem = model.root()
+        for item in root.depth_first():
+            if item is root:
                 continue
             index: QModelIndex = model.indexFromItem(item)
             path = item.path
             self._state[path] = {
                 'expanded': self.isExpanded(index),
-                'selected': index in selected
+                'selected': id(item) in selected
             }
 
     def restoreState(self):
@@ -342,10 +379,12 @@ class TreeView(QTreeView):
             return
         if not hasattr(self, '_state'):
             return
-        self.selectionModel().clearSelection()
+        selectionModel: QItemSelectionModel = self.selectionModel()
+        selectionModel.clearSelection()
         selection: QItemSelection = QItemSelection()
-        for item in model.root().depth_first():
-            if item is model.root():
+        root: AbstractTreeItem = model.root()
+        for item in root.depth_first():
+            if item is root:
                 continue
             index: QModelIndex = model.indexFromItem(item)
             path = item.path
@@ -354,9 +393,10 @@ class TreeView(QTreeView):
                 self.setExpanded(index, isExpanded)
                 isSelected = self._state[path].get('selected', False)
                 if isSelected:
-                    selection.merge(QItemSelection(index, index), QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows)
+                    # append range (merge rescans all existing ranges on every call)
+                    selection.select(index, index)
         if selection.count():
-            self.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows)
+            selectionModel.select(selection, QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows)
 
 
 def test_live():
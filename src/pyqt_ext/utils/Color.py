@@ -1,6 +1,7 @@
 """ PySide/PyQt color utils.
 """
 
+from functools import lru_cache
 from qtpy.QtGui import QColor
 
 
@@ -18,15 +19,8 @@ def toQColor(color: ColorType, name_map: dict[str, ColorType] = None) -> QColor:
         color = color.strip()
         if (name_map is not None) and (color in name_map):
             return toQColor(name_map[color])
-        elif QColor.isValidColorName(color):
-            return QColor(color)
-        else:
-            # (r,g,b) or (r,g,b,a)
-            color = color.lstrip('(').rstrip(')').split(',')
-            try:
-                color = [int(part) for part in color]
-            except:
-                color = [float(part) for part in color]
+        # copy the cached color so that the caller is free to modify it
+        return QColor(_strToQColor(color))
     # (r,g,b) or (r,g,b,a)
     if isinstance(color[0], int):
         return QColor(*color)
@@ -34,6 +28,23 @@ def toQColor(color: ColorType, name_map: dict[str, ColorType] = None) -> QColor:
         return QColor.fromRgbF(*color)
 
 
+@lru_cache(maxsize=256)
+def _strToQColor(color: str) -> QColor:
+    """ Parse a color name or '(r,g,b[,a])' string.
+
+    Cached because the same few color strings are converted over and over.
+    """
+    if QColor.isValidColorName(color):
+        return QColor(color)
+    # (r,g,b) or (r,g,b,a)
+    color = color.lstrip('(').rstrip(')').split(',')
+    try:
+        color = [int(part) for part in color]
+    except:
+        color = [float(part) for part in color]
+    return toQColor(color)
+
+
 def toColorStr(color: ColorType) -> str:
     """ Convert a color object to a string representation of the color.
     """
@@ -183,25 +183,18 @@ class MultiValueSpinBox(QAbstractSpinBox):
                 index_ranges.append([index])
             else:
                 index_ranges[-1].append(index)
+        if np.issubdtype(self._indexed_values.dtype, np.floating):
+            value_to_text = float_to_text
+        else:
+            value_to_text = str
         texts = []
         for index_range in index_ranges:
             if len(index_range) == 1:
-                value = self._indexed_values[index_range[0]]
-                if np.issubdtype(self._indexed_values.dtype, np.floating):
-                    value_text = f'{value:.6f}'.rstrip('0').rstrip('.')
-                else:
-                    value_text = str(value)
-                texts.append(value_text)
+                texts.append(value_to_text(self._indexed_values[index_range[0]]))
             else:
                 first_value = self._indexed_values[index_range[0]]
                 last_value = self._indexed_values[index_range[-1]]
-                if np.issubdtype(self._indexed_values.dtype, np.floating):
-                    first_value_text = f'{first_value:.6f}'.rstrip('0').rstrip('.')
-                    last_value_text = f'{last_value:.6f}'.rstrip('0').rstrip('.')
-                else:
-                    first_value_text = str(first_value)
-                    last_value_text = str(last_value)
-                texts.append(first_value_text + ':' + last_value_text)
+                texts.append(value_to_text(first_value) + ':' + value_to_text(last_value))
         text = ','.join(texts)
         return text
     
@@ -262,7 +255,13 @@ class MultiValueSpinBox(QAbstractSpinBox):
         #     return QValidator.Intermediate, text, pos
         return QValidator.Acceptable, text, pos
 
-    
+
+def float_to_text(value: float) -> str:
+    """ Format a float with up to 6 decimals and no trailing zeros.
+    """
+    return f'{value:.6f}'.rstrip('0').rstrip('.')
+
+
 def test_live():
     from qtpy.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QCheckBox
 
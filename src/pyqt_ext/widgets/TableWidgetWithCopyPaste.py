@@ -22,17 +22,21 @@ class TableWidgetWithCopyPaste(QTableWidget):
     
     def copy_selected_cells(self):
         copied_cells = sorted(self.selectedIndexes())
-        copy_text = ''
+        if not copied_cells:
+            return
         max_column = copied_cells[-1].column()
         max_row = copied_cells[-1].row()
+        # collect parts and join once (repeated str += is quadratic for large selections)
+        parts = []
         for c in copied_cells:
-            copy_text += self.item(c.row(), c.column()).text()
+            item = self.item(c.row(), c.column())
+            parts.append(item.text() if item is not None else '')
             if c.column() == max_column:
                 if c.row() != max_row:
-                    copy_text += '\n'
+                    parts.append('\n')
             else:
-                copy_text += '\t'
-        QApplication.clipboard().setText(copy_text)
+                parts.append('\t')
+        QApplication.clipboard().setText(''.join(parts))
     
     def paste_to_cells(self):
         selection = self.selectedIndexes()
@@ -40,13 +44,25 @@ class TableWidgetWithCopyPaste(QTableWidget):
             row_anchor = selection[0].row()
             column_anchor = selection[0].column()
             clipboard = QApplication.clipboard()
-            rows = clipboard.text().split('\n')
-            for indx_row, row in enumerate(rows):
-                values = row.split('\t')
-                for indx_col, value in enumerate(values):
-                    if row_anchor + indx_row < self.rowCount() and column_anchor + indx_col < self.columnCount():
-                        item = QTableWidgetItem(value)
-                        self.setItem(row_anchor + indx_row, column_anchor + indx_col, item)
+            # clip pasted block to the table bounds up front instead of checking every cell
+            rows = clipboard.text().split('\n')[:self.rowCount() - row_anchor]
+            max_columns = self.columnCount() - column_anchor
+            # repaint once after the whole block is filled
+            self.setUpdatesEnabled(False)
+            try:
+                for indx_row, row in enumerate(rows):
+                    values = row.split('\t')[:max_columns]
+                    for indx_col, value in enumerate(values):
+                        row_index = row_anchor + indx_row
+                        column_index = column_anchor + indx_col
+                        item = self.item(row_index, column_index)
+                        if item is None:
+                            self.setItem(row_index, column_index, QTableWidgetItem(value))
+                        else:
+                            # reuse existing item (keeps its flags/formatting and avoids reallocation)
+                            item.setText(value)
+            finally:
+                self.setUpdatesEnabled(True)
 
 
 def test_live():
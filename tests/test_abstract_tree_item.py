@@ -0,0 +1,144 @@
+from pyqt_ext.tree import AbstractTreeItem
+
+
+class DataNamedItem(AbstractTreeItem):
+    """ Item whose name is derived from its data.
+    """
+
+    def __init__(self, data: str, parent: AbstractTreeItem | None = None):
+        self._data = data
+        AbstractTreeItem.__init__(self, parent=parent)
+
+    @property
+    def name(self) -> str:
+        return self._data
+
+    @property
+    def data(self) -> str:
+        return self._data
+
+    @data.setter
+    def data(self, data: str) -> None:
+        self._data = data
+        self.invalidate_caches()
+
+
+def build_tree():
+    # r -> (a -> b, c)
+    root = AbstractTreeItem(name='r')
+    a = AbstractTreeItem(name='a', parent=root)
+    b = AbstractTreeItem(name='b', parent=a)
+    c = AbstractTreeItem(name='c', parent=root)
+    return root, a, b, c
+
+
+def test_path_follows_restructuring():
+    root, a, b, c = build_tree()
+    assert root.path == '/'
+    assert b.path == '/a/b'
+    b.parent = c
+    assert b.path == '/c/b'
+    root.insert_child(0, c)
+    assert b.path == '/c/b'
+    c.parent = a
+    assert b.path == '/a/c/b'
+
+
+def test_path_follows_rename():
+    root, a, b, c = build_tree()
+    assert b.path == '/a/b'
+    a.name = 'x'
+    assert b.path == '/x/b'
+    assert root['x/b'] is b
+    assert root['a/b'] is None
+
+
+def test_path_follows_data_derived_name():
+    root = AbstractTreeItem(name='r')
+    x = DataNamedItem('x', parent=root)
+    child = DataNamedItem('z', parent=x)
+    assert child.path == '/x/z'
+    x.data = 'y'
+    assert x.path == '/y'
+    assert child.path == '/y/z'
+
+
+def test_getitem_first_duplicate_wins():
+    root = AbstractTreeItem(name='r')
+    first = AbstractTreeItem(name='d', parent=root)
+    second = AbstractTreeItem(name='d', parent=root)
+    assert root['d'] is first
+    assert root['/d'] is first
+    root.insert_child(0, second)
+    assert root['d'] is second
+    second.name = 'e'
+    assert root['d'] is first
+    assert root['e'] is second
+    assert root['missing'] is None
+    assert root['d/missing'] is None
+
+
+def test_getitem_follows_data_derived_name():
+    root = AbstractTreeItem(name='r')
+    x = DataNamedItem('x', parent=root)
+    child = DataNamedItem('z', parent=x)
+    assert root['x'] is x
+    x.data = 'y'
+    assert root['x'] is None
+    assert root['y'] is x
+    assert root['y/z'] is child
+
+
+def test_flatten():
+    # r -> (x -> y, z)
+    root = AbstractTreeItem(name='r')
+    x = AbstractTreeItem(name='x', parent=root)
+    AbstractTreeItem(name='y', parent=x)
+    AbstractTreeItem(name='z', parent=root)
+    parent_idx, depths, first_child, next_sibling = root.flatten()
+    assert parent_idx.tolist() == [-1, 0, 1, 0]
+    assert depths.tolist() == [0, 1, 2, 1]
+    assert first_child.tolist() == [1, 2, -1, -1]
+    assert next_sibling.tolist() == [-1, 3, -1, -1]
+    # depths are relative to the flattened branch
+    parent_idx, depths, first_child, next_sibling = x.flatten()
+    assert parent_idx.tolist() == [-1, 0]
+    assert depths.tolist() == [0, 1]
+    assert first_child.tolist() == [1, -1]
+    assert next_sibling.tolist() == [-1, -1]
+
+
+def test_deepcopy_and_pickle():
+    import copy
+    import pickle
+    root, a, b, c = build_tree()
+    for root2 in [copy.deepcopy(root), pickle.loads(pickle.dumps(root))]:
+        assert str(root2) == str(root)
+        b2 = root2['a/b']
+        assert b2 is not b
+        assert b2.parent is root2['a']
+        assert b2.parent.parent is root2
+        assert b2.path == '/a/b'
+        assert b2.depth() == 2
+        assert root2['c'].sibling_index == 1
+    # a copied branch is the root of its own tree
+    a2 = copy.deepcopy(a)
+    assert a2.parent is None
+    assert a2['b'].path == '/b'
+    assert a2['b'].depth() == 1
+    assert a.parent is root
+
+
+def test_removed_child_not_kept_alive_by_lookup():
+    import gc
+    import weakref
+    root = AbstractTreeItem(name='r')
+    c = AbstractTreeItem(name='c', parent=root)
+    g = AbstractTreeItem(name='g', parent=c)
+    assert root['c/g'] is g
+    refs = [weakref.ref(c), weakref.ref(g)]
+    root.remove_child(c)
+    del c, g
+    # parent <-> children is a reference cycle, so needs the cycle collector
+    gc.collect()
+    assert all(ref() is None for ref in refs)
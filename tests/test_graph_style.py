@@ -0,0 +1,47 @@
+import json
+import pytest
+from pyqt_ext.graph import GraphStyle
+
+
+def test_getitem_fallbacks():
+    style = GraphStyle(color='red', lw=2)
+    assert style['markeredgecolor'] == 'red'
+    assert style['markeredgewidth'] == 2
+    assert style['marker'] == 'none'
+    assert 'marker' not in style
+    assert dict(style) == {'color': 'red', 'linewidth': 2}
+
+
+def test_pop_only_set_styles():
+    style = GraphStyle(color='red')
+    assert style.pop('marker', 'dflt') == 'dflt'
+    with pytest.raises(KeyError):
+        GraphStyle().pop('marker')
+    assert style.pop('c') == 'red'
+    assert len(style) == 0
+
+
+def test_setdefault_only_set_styles():
+    style = GraphStyle()
+    assert style.setdefault('marker', 'o') == 'o'
+    assert style.setdefault('marker', 's') == 'o'
+    assert dict(style) == {'marker': 'o'}
+
+
+def test_unknown_key():
+    with pytest.raises(KeyError):
+        GraphStyle({'color': 'red', 'label': 'data'})
+
+
+def test_json_via_dict():
+    style = GraphStyle(color='red', marker='o')
+    assert json.loads(json.dumps(dict(style))) == {'color': 'red', 'marker': 'o'}
+
+
+def test_contains_non_str_key():
+    style = GraphStyle(color='red')
+    assert 'c' in style
+    assert 1 not in style
+    assert None not in style
+    assert style.get(1, 'dflt') == 'dflt'
+    assert style.pop(1, 'dflt') == 'dflt'
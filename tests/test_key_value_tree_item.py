@@ -0,0 +1,47 @@
+import copy
+import pickle
+from pyqt_ext.tree import KeyValueTreeItem
+
+
+def test_deepcopy_edits_copied_data():
+    data = {'a': 1, 'b': 2}
+    root = KeyValueTreeItem('/', data)
+    root2 = copy.deepcopy(root)
+    root2.children[0].key = 'zzz'
+    assert data == {'a': 1, 'b': 2}
+    assert root2.value == {'b': 2, 'zzz': 1}
+
+
+def test_pickle():
+    root = KeyValueTreeItem('/', {'a': {'b': [1, {'c': 2}]}})
+    root2 = pickle.loads(pickle.dumps(root))
+    assert root2.value == root.value
+    assert root2['a/b/1/c'].path == '/a/b/1/c'
+    root2['a/b/1/c'].value = 3
+    assert root.value['a']['b'][1]['c'] == 2
+    assert root2.value['a']['b'][1]['c'] == 3
+
+
+
+def test_temporary_root_keeps_ancestry():
+    item = KeyValueTreeItem('/', {'a': {'b': 1}})['a/b']
+    assert item.path == '/a/b'
+    assert item.depth() == 2
+    assert item.root.value == {'a': {'b': 1}}
+
+
+def test_subtree_items_are_constructed():
+    class TaggedItem(KeyValueTreeItem):
+
+        def __init__(self, key, value, parent=None, _link_only=False):
+            self.tag = 'tagged'
+            KeyValueTreeItem.__init__(self, key, value, parent, _link_only)
+
+    data = {'a': {'b': [1, 2]}}
+    root = TaggedItem('/', data)
+    items = list(root.depth_first())
+    assert len(items) == 5
+    assert all(isinstance(item, TaggedItem) and item.tag == 'tagged' for item in items)
+    assert root['a/b/1'].value == 2
+    # building the subtree does not modify the data
+    assert data == {'a': {'b': [1, 2]}}